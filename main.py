@@ -32,6 +32,11 @@ from src.dashboard_logic import (
     render_data_filters,
     plot_physical_radar
 )
+from src.data_export import (
+    EXPORT_FORMATS,
+    table_to_bytes,
+    all_positions_to_bytes
+)
 
 # Constants & Configuration
 PAGE_CONFIG = {
@@ -71,6 +76,24 @@ def load_all_data() -> dict:
     return data_store
 
 
+@st.cache_data
+def export_table_cached(df: pd.DataFrame, fmt: str) -> bytes:
+    """
+    Serializes the current filtered view in the requested format.
+    Cached so unrelated reruns do not re-serialize an unchanged table.
+    """
+    return table_to_bytes(df, fmt=fmt)
+
+
+@st.cache_data
+def export_all_positions_cached(df_phys: pd.DataFrame, fmt: str, percentile: bool) -> bytes:
+    """
+    Builds the full precomputed table for all positions in the requested format.
+    Cached because it reruns the display pipeline for every position group.
+    """
+    return all_positions_to_bytes(df_phys, fmt=fmt, percentile=percentile)
+
+
 # =============================================================================
 # 3. UI COMPONENT FUNCTIONS
 # =============================================================================
@@ -104,6 +127,40 @@ def render_sidebar_filters(df: pd.DataFrame) -> str:
     
     return selected_position
 
+
+def render_export_controls(filtered_table: pd.DataFrame, df_phys: pd.DataFrame, position: str):
+    """
+    Renders download buttons for the current filtered view and for the
+    full table across all position groups (raw or percentile, following the toggle).
+    
+    Args:
+        filtered_table (pd.DataFrame): Output of 'render_data_filters'.
+        df_phys (pd.DataFrame): The aggregated physical source data.
+        position (str): The selected position group, used in the file name.
+    """
+    percentile = st.session_state.get('percentile_toggle', False)
+    suffix = 'percentile' if percentile else 'raw'
+
+    c1, c2, c3 = st.columns([1, 2, 2])
+    with c1:
+        fmt = st.selectbox('Export format', options=list(EXPORT_FORMATS))
+    extension, mime = EXPORT_FORMATS[fmt]
+
+    with c2:
+        st.download_button(
+            '⬇️ Download current view',
+            data=export_table_cached(filtered_table, fmt),
+            file_name=f"{position.lower().replace(' ', '_')}_{suffix}{extension}",
+            mime=mime
+        )
+    with c3:
+        st.download_button(
+            '⬇️ Download all positions',
+            data=export_all_positions_cached(df_phys, fmt, percentile),
+            file_name=f"all_positions_{suffix}{extension}",
+            mime=mime
+        )
+
 # =============================================================================
 # 4. MAIN APPLICATION LOGIC
 # =============================================================================
@@ -145,6 +202,7 @@ def main():
     
     # Display Table
     st.dataframe(final_filtered_table.dropna(axis=1, how='all').style.format(precision=2))
+    render_export_controls(final_filtered_table, data_store['aggregated_physical_data'], selected_position)
     st.divider()
 
     # 7. Radar Chart Section
@@ -55,6 +55,10 @@ def calculate_percentile_score(df_input):
         )
     return pd.DataFrame(percentiel_scores_dict)
 
+def _filter_range(df_input, column, value_range):
+    """Keeps rows whose value in `column` lies inside the inclusive (min, max) range."""
+    return df_input[(df_input[column] >= value_range[0]) & (df_input[column] <= value_range[1])]
+
 # =============================================================================
 # 3. DATA TRANSFORMATION PIPELINE
 # =============================================================================
@@ -160,12 +164,12 @@ def render_data_filters(df_display: pd.DataFrame, df_percentile: pd.DataFrame):
         # Age Filter
         min_age, max_age = int(working_df['Age'].min()), int(working_df['Age'].max())
         age_range = st.slider('Age', min_value=min_age, max_value=max_age, value=(17, 42))
-        working_df = working_df[(working_df['Age'] >= age_range[0]) & (working_df['Age'] <= age_range[1])]
+        working_df = _filter_range(working_df, 'Age', age_range)
 
         # Matches Filter
         min_match, max_match = int(working_df['Matches'].min()), int(working_df['Matches'].max())
         match_range = st.slider('Matches', min_value=min_match, max_value=max_match, value=(min_match, max_match))
-        working_df = working_df[(working_df['Matches'] >= match_range[0]) & (working_df['Matches'] <= match_range[1])]
+        working_df = _filter_range(working_df, 'Matches', match_range)
 
         # Reset Index for Display
         working_df = working_df.set_index(['Player', 'Team', 'Age', 'Matches'])
@@ -191,7 +195,57 @@ def render_data_filters(df_display: pd.DataFrame, df_percentile: pd.DataFrame):
             for param in params_to_filter:
                 p_min, p_max = int(working_df[param].min()), int(working_df[param].max())
                 val_range = st.slider(param, min_value=p_min, max_value=p_max, value=(p_min, p_max))
-                working_df = working_df[(working_df[param] >= val_range[0]) & (working_df[param] <= val_range[1])]
+                working_df = _filter_range(working_df, param, val_range)
+
+    return working_df
+
+
+def filter_physical_table(
+    df_display: pd.DataFrame,
+    df_percentile: pd.DataFrame,
+    percentile: bool = False,
+    age_range: tuple = (17, 42),
+    match_range: tuple = None,
+    columns: list = None,
+    value_ranges: dict = None
+) -> pd.DataFrame:
+    """
+    Headless counterpart of 'render_data_filters' for use from scripts.
+    Applies the same Age, Matches, metric selection and value-range filters
+    without any Streamlit widgets.
+
+    Args:
+        df_display (pd.DataFrame): Raw table from 'prepare_physical_data_for_display'.
+        df_percentile (pd.DataFrame): Percentile table from the same pipeline.
+        percentile (bool): Use the percentile table instead of the raw values.
+        age_range (tuple): Inclusive (min, max) age. Defaults to the dashboard slider value.
+        match_range (tuple): Inclusive (min, max) matches played. None keeps all.
+        columns (list): Metrics to keep. Defaults to DEFAULT_METRICS.
+        value_ranges (dict): Metric name -> inclusive (min, max) range.
+
+    Returns:
+        pd.DataFrame: Filtered table indexed by Player, Team, Age and Matches.
+    """
+    working_df = (df_percentile if percentile else df_display).reset_index()
+
+    # Demographic Filters
+    if age_range is not None:
+        working_df = _filter_range(working_df, 'Age', age_range)
+    if match_range is not None:
+        working_df = _filter_range(working_df, 'Matches', match_range)
+    working_df = working_df.set_index(['Player', 'Team', 'Age', 'Matches'])
+
+    # Metric Column Selection (mirrors the dashboard fallback)
+    selected_columns = list(columns) if columns else list(DEFAULT_METRICS)
+    if percentile:
+        selected_columns = ['Explosivity', 'Volume', 'Total'] + selected_columns
+    working_df = working_df[selected_columns]
+
+    # Value-based Filtering
+    for param, val_range in (value_ranges or {}).items():
+        if param not in working_df.columns:
+            raise KeyError(f"Cannot filter on '{param}': not among the selected columns.")
+        working_df = _filter_range(working_df, param, val_range)
 
     return working_df
 
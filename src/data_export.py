@@ -0,0 +1,150 @@
+"""
+Bulk Export Module
+==================
+Description:
+    Writes the dashboard tables (raw or percentile) to Parquet, Arrow IPC or CSV.
+    Rows are streamed to disk in fixed-size record batches, so neither a styled
+    copy nor a second full copy of the table is ever held in memory.
+    All functions are headless and can be used from scripts, e.g.:
+
+        df_display, df_percentile, _, _ = prepare_physical_data_for_display(df_phys, 'Central Midfield')
+        table = filter_physical_table(df_display, df_percentile, match_range=(10, 30))
+        write_table(table, 'central_midfield.parquet')
+"""
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from src.dashboard_logic import prepare_physical_data_for_display, filter_physical_table
+
+
+# =============================================================================
+# 1. GLOBAL CONFIGURATIONS
+# =============================================================================
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Format name -> (file extension, MIME type)
+EXPORT_FORMATS = {
+    'parquet': ('.parquet', 'application/vnd.apache.parquet'),
+    'arrow': ('.arrow', 'application/vnd.apache.arrow.file'),
+    'csv': ('.csv', 'text/csv')
+}
+
+# =============================================================================
+# 2. INTERNAL UTILITIES
+# =============================================================================
+
+def _open_writer(sink, fmt, schema):
+    """Opens a streaming writer for the requested format."""
+    if fmt == 'parquet':
+        return pq.ParquetWriter(sink, schema)
+    if fmt == 'arrow':
+        return pa.ipc.new_file(sink, schema)
+    if fmt == 'csv':
+        return pa_csv.CSVWriter(sink, schema)
+    raise ValueError(f"Unsupported export format '{fmt}'. Choose from {list(EXPORT_FORMATS)}.")
+
+def _flatten(df_slice, leading_columns=None):
+    """Resets the index and prepends constant columns (e.g. 'Position')."""
+    chunk = df_slice.reset_index()
+    for position, (name, value) in enumerate((leading_columns or {}).items()):
+        chunk.insert(position, name, value)
+    return chunk
+
+def _iter_chunks(df, chunk_size, leading_columns=None):
+    """Yields flat (index reset) slices of at most `chunk_size` rows."""
+    for start in range(0, len(df), chunk_size):
+        yield _flatten(df.iloc[start:start + chunk_size], leading_columns)
+
+def _infer_schema(sample):
+    """
+    Derives the Arrow schema from a sample chunk. Columns pyarrow can only type
+    as `null` (empty, or all missing in the sample) fall back to their pandas dtype.
+    """
+    schema = pa.Schema.from_pandas(sample, preserve_index=False)
+    for i, field in enumerate(schema):
+        if pa.types.is_null(field.type):
+            dtype = sample[field.name].dtype
+            arrow_type = pa.string() if dtype == object else pa.from_numpy_dtype(dtype)
+            schema = schema.set(i, field.with_type(arrow_type))
+    return schema
+
+def _write_frames(frames, sink, fmt, chunk_size):
+    """
+    Streams (DataFrame, leading_columns) pairs into a single output.
+    The schema is taken from the first full chunk; later chunks are cast to it.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    writer, schema = None, None
+    try:
+        for df, leading_columns in frames:
+            chunks = _iter_chunks(df, chunk_size, leading_columns)
+            if writer is None:
+                # Empty tables still get a typed header
+                first_chunk = next(chunks, None)
+                sample = first_chunk if first_chunk is not None else _flatten(df.iloc[:0], leading_columns)
+                schema = _infer_schema(sample)
+                writer = _open_writer(sink, fmt, schema)
+                if first_chunk is not None:
+                    writer.write_batch(pa.RecordBatch.from_pandas(first_chunk, schema=schema, preserve_index=False))
+            for chunk in chunks:
+                writer.write_batch(pa.RecordBatch.from_pandas(chunk, schema=schema, preserve_index=False))
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        raise ValueError("Nothing to export: no tables were provided.")
+
+# =============================================================================
+# 3. PUBLIC EXPORT API
+# =============================================================================
+
+def write_table(df, sink, fmt='parquet', chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Writes a (filtered) dashboard table to Parquet, Arrow IPC or CSV.
+
+    Args:
+        df (pd.DataFrame): Table as returned by 'render_data_filters' or 'filter_physical_table'.
+        sink (str | file-like): Output path or writable binary buffer.
+        fmt (str): One of EXPORT_FORMATS.
+        chunk_size (int): Rows per streamed record batch.
+    """
+    _write_frames([(df, None)], sink, fmt, chunk_size)
+
+def export_all_positions(df_phys, sink, fmt='parquet', percentile=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Runs the display pipeline for every position group and streams all tables
+    into one output, with a leading 'Position' column. Each table is reshaped
+    like the dashboard view, so both exports share one column layout.
+
+    Args:
+        df_phys (pd.DataFrame): Aggregated physical data as loaded from SkillCorner.
+        sink (str | file-like): Output path or writable binary buffer.
+        fmt (str): One of EXPORT_FORMATS.
+        percentile (bool): Export percentile scores instead of raw values.
+        chunk_size (int): Rows per streamed record batch.
+    """
+    def position_tables():
+        for position in sorted(df_phys['position_group'].unique()):
+            df_display, df_percentile, _, _ = prepare_physical_data_for_display(df_phys, position)
+            table = filter_physical_table(df_display, df_percentile, percentile=percentile, age_range=None)
+            yield table, {'Position': position}
+
+    _write_frames(position_tables(), sink, fmt, chunk_size)
+
+def table_to_bytes(df, fmt='parquet', chunk_size=DEFAULT_CHUNK_SIZE):
+    """In-memory variant of 'write_table', used for Streamlit download buttons."""
+    buffer = pa.BufferOutputStream()
+    write_table(df, buffer, fmt, chunk_size)
+    return buffer.getvalue().to_pybytes()
+
+def all_positions_to_bytes(df_phys, fmt='parquet', percentile=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """In-memory variant of 'export_all_positions', used for Streamlit download buttons."""
+    buffer = pa.BufferOutputStream()
+    export_all_positions(df_phys, buffer, fmt, percentile, chunk_size)
+    return buffer.getvalue().to_pybytes()
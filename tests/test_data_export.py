@@ -0,0 +1,180 @@
+"""
+Tests for the headless filter and the bulk export module.
+"""
+
+import contextlib
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import pytest
+
+from src import dashboard_logic
+from src.dashboard_logic import (
+    DEFAULT_METRICS,
+    prepare_physical_data_for_display,
+    filter_physical_table,
+    render_data_filters
+)
+from src.data_export import (
+    EXPORT_FORMATS,
+    table_to_bytes,
+    all_positions_to_bytes
+)
+
+POSITIONS = ['Central Midfield', 'Defensive Midfield']
+
+
+# =============================================================================
+# 1. FIXTURES & HELPERS
+# =============================================================================
+
+def make_physical_data(rows_per_position=30, seed=0):
+    """Builds a synthetic aggregated physical dataset with the SkillCorner columns used by the pipeline."""
+    rng = np.random.default_rng(seed)
+    n = rows_per_position * len(POSITIONS)
+    metric_columns = [
+        'psv99', 'timetohsr_top3',
+        'total_metersperminute_full_tip', 'hsr_distance_full_tip', 'sprint_distance_full_tip', 'minutes_full_tip',
+        'highaccel_count_full_tip', 'highdecel_count_full_tip',
+        'total_metersperminute_full_otip', 'hsr_distance_full_otip', 'sprint_distance_full_otip', 'minutes_full_otip',
+        'highaccel_count_full_otip', 'highdecel_count_full_otip',
+        'highaccel_count_full_all', 'highdecel_count_full_all', 'sprint_count_full_all',
+        'sprint_distance_full_all', 'total_metersperminute_full_all', 'running_distance_full_all',
+        'hi_distance_full_all', 'hi_count_full_all'
+    ]
+    df = pd.DataFrame({column: rng.uniform(1, 100, n) for column in metric_columns})
+    df['position_group'] = np.repeat(POSITIONS, rows_per_position)
+    df['player_short_name'] = [f'Player {i:03d}' for i in range(n)]
+    df['team_name'] = rng.choice(['Adelaide', 'Brisbane', 'Perth'], n)
+    df['count_match'] = rng.integers(1, 30, n)
+    df['player_birthdate'] = pd.to_datetime('1990-01-01') + pd.to_timedelta(rng.integers(0, 5000, n), unit='D')
+    return df
+
+@pytest.fixture(scope='module')
+def df_phys():
+    return make_physical_data()
+
+@pytest.fixture(scope='module')
+def position_tables(df_phys):
+    df_display, df_percentile, _, _ = prepare_physical_data_for_display(df_phys, POSITIONS[0])
+    return df_display, df_percentile
+
+def read_back(data, fmt):
+    """Reads exported bytes back into a pyarrow Table."""
+    if fmt == 'parquet':
+        return pq.read_table(pa.BufferReader(data))
+    if fmt == 'arrow':
+        return pa.ipc.open_file(pa.BufferReader(data)).read_all()
+    return pa_csv.read_csv(pa.BufferReader(data), convert_options=pa_csv.ConvertOptions(strings_can_be_null=True))
+
+class FakeStreamlit:
+    """Minimal stand-in for the widgets used by 'render_data_filters'."""
+
+    def __init__(self, percentile, sliders=None, multiselects=None):
+        self.session_state = {'percentile_toggle': percentile}
+        self.sliders = sliders or {}
+        self.multiselects = multiselects or {}
+
+    def checkbox(self, label, key):
+        return self.session_state[key]
+
+    def columns(self, spec):
+        return [contextlib.nullcontext() for _ in spec]
+
+    def slider(self, label, min_value, max_value, value):
+        return self.sliders.get(label, value)
+
+    def multiselect(self, label, options):
+        return self.multiselects.get(label, [])
+
+# =============================================================================
+# 2. HEADLESS FILTER
+# =============================================================================
+
+@pytest.mark.parametrize('percentile', [False, True])
+def test_filter_matches_dashboard_filters(monkeypatch, position_tables, percentile):
+    df_display, df_percentile = position_tables
+    columns = ['Top Speed', 'HSR m/min TIP']
+    value_param = 'Total' if percentile else 'Top Speed'
+    sliders = {'Age': (20, 30), 'Matches': (5, 25), value_param: (10, 90)}
+    multiselects = {'Show parameters': columns, 'Filter parameters': [value_param]}
+
+    monkeypatch.setattr(dashboard_logic, 'st', FakeStreamlit(percentile, sliders, multiselects))
+    expected = render_data_filters(df_display, df_percentile)
+
+    result = filter_physical_table(
+        df_display, df_percentile,
+        percentile=percentile,
+        age_range=(20, 30),
+        match_range=(5, 25),
+        columns=columns,
+        value_ranges={value_param: (10, 90)}
+    )
+    assert not result.empty
+    pd.testing.assert_frame_equal(result, expected)
+
+def test_filter_defaults_to_all_metrics(position_tables):
+    df_display, df_percentile = position_tables
+    result = filter_physical_table(df_display, df_percentile, percentile=True, age_range=None)
+    assert list(result.columns) == ['Explosivity', 'Volume', 'Total'] + DEFAULT_METRICS
+    assert list(result.index.names) == ['Player', 'Team', 'Age', 'Matches']
+    assert len(result) == len(df_percentile)
+
+def test_filter_rejects_unselected_value_range(position_tables):
+    df_display, df_percentile = position_tables
+    with pytest.raises(KeyError):
+        filter_physical_table(df_display, df_percentile, columns=['Top Speed'], value_ranges={'Total': (0, 50)})
+
+# =============================================================================
+# 3. EXPORT ROUND-TRIPS
+# =============================================================================
+
+@pytest.mark.parametrize('fmt', list(EXPORT_FORMATS))
+def test_export_round_trip_across_chunks(position_tables, fmt):
+    df_display, df_percentile = position_tables
+    table = filter_physical_table(df_display, df_percentile, age_range=None)
+    assert len(table) == 30
+
+    result = read_back(table_to_bytes(table, fmt, chunk_size=7), fmt).to_pandas()
+    pd.testing.assert_frame_equal(result, table.reset_index(), check_dtype=(fmt != 'csv'))
+
+@pytest.mark.parametrize('fmt', list(EXPORT_FORMATS))
+def test_export_null_in_first_row(position_tables, fmt):
+    df_display, _ = position_tables
+    flat = df_display.reset_index()
+    flat.loc[0, 'Team'] = None
+    table = flat.set_index(['Player', 'Age', 'Team', 'Matches'])
+
+    result = read_back(table_to_bytes(table, fmt, chunk_size=7), fmt)
+    assert result.num_rows == len(table)
+    assert result.schema.field('Team').type == pa.string()
+    assert result.column('Team').null_count == 1
+
+@pytest.mark.parametrize('fmt', list(EXPORT_FORMATS))
+def test_export_empty_table(position_tables, fmt):
+    df_display, df_percentile = position_tables
+    table = filter_physical_table(df_display, df_percentile, age_range=(200, 300))
+    assert table.empty
+
+    result = read_back(table_to_bytes(table, fmt), fmt)
+    assert result.num_rows == 0
+    assert result.column_names == list(table.reset_index().columns)
+
+@pytest.mark.parametrize('fmt', list(EXPORT_FORMATS))
+@pytest.mark.parametrize('percentile', [False, True])
+def test_all_positions_matches_view_layout(df_phys, position_tables, fmt, percentile):
+    df_display, df_percentile = position_tables
+    view = filter_physical_table(df_display, df_percentile, percentile=percentile, age_range=None)
+
+    result = read_back(all_positions_to_bytes(df_phys, fmt, percentile=percentile, chunk_size=7), fmt)
+    assert result.column_names == ['Position'] + list(view.reset_index().columns)
+    assert result.num_rows == len(df_phys)
+    assert sorted(set(result.column('Position').to_pylist())) == POSITIONS
+
+def test_unknown_format_raises(position_tables):
+    df_display, _ = position_tables
+    with pytest.raises(ValueError):
+        table_to_bytes(df_display, 'xlsx')